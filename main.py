@@ -11,9 +11,10 @@ Files created in the same folder as this script:
 - readme.md
 """
 import os
-import csv
-import random
-import string
+import sys
+from collections import defaultdict
+import hashlib
+import hmac
 from datetime import datetime
 
 # -------------------------------
@@ -25,20 +26,37 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 USERS_FILE = os.path.join(SCRIPT_DIR, "users.txt")
 SESSIONS_FILE = os.path.join(SCRIPT_DIR, "sessions.txt")
 
+# Number of fields in each users.txt / sessions.txt row.
+USER_FIELDS = 4     # username, password, role, email
+SESSION_FIELDS = 8  # id, coach, client, date, time, link, status, notes
+
 JITSI_BASE_URL = "https://meet.jit.si/"
 ROOM_PREFIX = "FitnessSession_"
+JITSI_ROOM_URL_PREFIX = JITSI_BASE_URL + ROOM_PREFIX
+
+# Session date and time as entered by the user: "YYYY-MM-DD HH:MM".
+# Compiled on first use so `re` is only imported when scheduling or editing.
+_DT_PATTERN = r"^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})$"
+_DT_RE = None
+
+# Separator line printed between sessions in the "My Sessions" listing.
+_SEP = "-" * 60
+
+# In-memory copy of users.txt, refreshed only when the file's mtime changes.
+_USER_CACHE = {"mtime": None, "rows": None, "by_user": None}
+# Same for sessions.txt, with an index from session id to (index, row) and
+# indexes from coach/client username to that user's rows.
+_SESSION_CACHE = {"mtime": None, "rows": None, "by_id": None, "by_coach": None, "by_client": None}
+
 # -------------------------------
 # Helper: ensure data files exist
 # -------------------------------
 
 def bootstrap_files():
     """Create empty data files if they don't exist yet."""
-    if not os.path.exists(USERS_FILE):
-        with open(USERS_FILE, "w", newline="", encoding="utf-8") as f:
-            pass
-    if not os.path.exists(SESSIONS_FILE):
-        with open(SESSIONS_FILE, "w", newline="", encoding="utf-8") as f:
-            pass
+    # Append mode creates a missing file and leaves an existing one untouched.
+    open(USERS_FILE, "a", encoding="utf-8").close()
+    open(SESSIONS_FILE, "a", encoding="utf-8").close()
 
 # -------------------------------
 # File I/O helpers
@@ -48,80 +66,241 @@ def load_from_file(filepath):
     """
     Read CSV-like rows from a text file and return a list of lists (rows).
     Empty lines are skipped.
+    Only meant for users.txt and sessions.txt. New rows never contain commas or
+    quotes, so most lines are simply split on commas; lines with a quote come
+    from older versions of the app (which used csv.writer) and go through csv.
     """
+    try:
+        f = open(filepath, "r", newline="", encoding="utf-8", buffering=1 << 20)
+    except FileNotFoundError:
+        return []
     rows = []
-    if not os.path.exists(filepath):
-        return rows
-    with open(filepath, "r", newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not row:
+    with f:
+        for line in f:
+            if not line.strip():
                 continue
-            rows.append(row)
+            if '"' in line:
+                import csv  # only needed for quoted legacy rows
+
+                rows.append(next(csv.reader([line])))
+            else:
+                rows.append(line.rstrip("\r\n").split(","))
     return rows
 
-def save_to_file(filepath, rows):
+def _write_row_fast(f, row):
     """
-    Write a list of lists to a CSV-like text file, overwriting existing content.
-    Each inner list is written as one line.
+    Write one row as a plain comma-joined line.
+    New fields never contain commas (input validation rejects them), so no quoting
+    is needed; legacy rows with commas or quotes in a field are quoted via csv.
     """
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        for row in rows:
-            writer.writerow(row)
+    line = ",".join(row)
+    if '"' in line or line.count(",") != len(row) - 1:
+        import csv  # only needed for legacy rows
+
+        csv.writer(f, lineterminator="\n").writerow(row)
+        return
+    f.write(line)
+    f.write("\n")
+
+def ends_with_newline(filepath):
+    """Return True if the file is missing, empty, or its last byte is a newline."""
+    try:
+        with open(filepath, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except FileNotFoundError:
+        return True
+
+def append_row(filepath, row):
+    """
+    Append a single row to the end of a CSV-like text file.
+    If the file was hand-edited and lacks a final newline, one is added first
+    so the new row doesn't get glued onto the last line.
+    """
+    needs_newline = not ends_with_newline(filepath)
+    with open(filepath, "a", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        if needs_newline:
+            f.write("\n")
+        _write_row_fast(f, row)
 
 # -------------------------------
-# Authentication
+# Cached data access
 # -------------------------------
 
-def register_user():
+def file_mtime(filepath):
+    """Return the file's modification time in nanoseconds, or -1 if it is missing."""
+    try:
+        return os.stat(filepath).st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+def get_users():
     """
-    Create a new user. Role must be 'coach' or 'client'.
-    Duplicate usernames are not allowed.
+    Return (rows, by_user) for users.txt, re-reading the file only if it changed.
+    by_user maps each username to its [username, password, role, email] row.
+    Rows without exactly USER_FIELDS fields stay in rows but are left out of
+    by_user, so code using the index never has to check row width.
     """
-    print("\n=== Register New User ===")
-    users = load_from_file(USERS_FILE)
-    existing_usernames = {u[0] for u in users}  # u = [username,password,role,email]
+    mtime = file_mtime(USERS_FILE)
+    if _USER_CACHE["mtime"] != mtime:
+        rows = load_from_file(USERS_FILE)
+        _USER_CACHE["rows"] = rows
+        _USER_CACHE["by_user"] = {row[0]: row for row in rows if len(row) == USER_FIELDS}
+        _USER_CACHE["mtime"] = mtime
+    return _USER_CACHE["rows"], _USER_CACHE["by_user"]
+
+def get_sessions():
+    """
+    Return (rows, by_id) for sessions.txt, re-reading the file only if it changed.
+    by_id maps each session id to its (index, row) pair in rows.
+    Rows without exactly SESSION_FIELDS fields stay in rows, so flush_sessions
+    writes them back untouched, but are left out of every index.
+    """
+    mtime = file_mtime(SESSIONS_FILE)
+    if _SESSION_CACHE["mtime"] != mtime:
+        rows = load_from_file(SESSIONS_FILE)
+        by_id = {}
+        by_coach = defaultdict(list)
+        by_client = defaultdict(list)
+        for i, row in enumerate(rows):
+            if len(row) != SESSION_FIELDS:
+                continue
+            by_id[row[0]] = (i, row)
+            by_coach[row[1]].append(row)
+            by_client[row[2]].append(row)
+        _SESSION_CACHE["rows"] = rows
+        _SESSION_CACHE["by_id"] = by_id
+        _SESSION_CACHE["by_coach"] = by_coach
+        _SESSION_CACHE["by_client"] = by_client
+        _SESSION_CACHE["mtime"] = mtime
+    return _SESSION_CACHE["rows"], _SESSION_CACHE["by_id"]
+
+def get_session_indexes():
+    """
+    Return (by_coach, by_client) for sessions.txt.
+    Each maps a username to the list of that user's session rows, in file order.
+    """
+    get_sessions()
+    return _SESSION_CACHE["by_coach"], _SESSION_CACHE["by_client"]
+
+def add_user(row):
+    """Append a new user row to users.txt and record it in the cache."""
+    assert len(row) == USER_FIELDS
+    rows, by_user = get_users()
+    append_row(USERS_FILE, row)
+    rows.append(row)
+    by_user[row[0]] = row
+    _USER_CACHE["mtime"] = file_mtime(USERS_FILE)
+
+def add_session(row):
+    """Append a new session row to sessions.txt and record it in the cache."""
+    assert len(row) == SESSION_FIELDS
+    rows, by_id = get_sessions()
+    append_row(SESSIONS_FILE, row)
+    by_id[row[0]] = (len(rows), row)
+    _SESSION_CACHE["by_coach"][row[1]].append(row)
+    _SESSION_CACHE["by_client"][row[2]].append(row)
+    rows.append(row)
+    _SESSION_CACHE["mtime"] = file_mtime(SESSIONS_FILE)
+
+def flush_sessions():
+    """
+    Write the cached session rows back to sessions.txt in one pass.
+    Rows go to a temporary file first, which then replaces sessions.txt, so a
+    failure part-way through never leaves the real file truncated.
+    """
+    tmp_path = SESSIONS_FILE + ".tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        for row in _SESSION_CACHE["rows"]:
+            _write_row_fast(f, row)
+    os.replace(tmp_path, SESSIONS_FILE)
+    _SESSION_CACHE["mtime"] = file_mtime(SESSIONS_FILE)
 
-    while True:
-        username = input("Choose a username: ").strip()
-        if not username:
-            print("Username cannot be empty.")
-            continue
-        if "," in username:
-            print("Commas are not allowed in username.")
-            continue
-        if username in existing_usernames:
-            print("That username is already taken. Try another.")
-            continue
-        break
+# -------------------------------
+# Authentication
+# -------------------------------
 
-    while True:
-        password = input("Choose a password: ").strip()
-        if not password:
-            print("Password cannot be empty.")
-            continue
-        break
+# Registration fields in the order they are asked for.
+REGISTER_PROMPTS = {
+    "username": "Choose a username: ",
+    "password": "Choose a password: ",
+    "role": "Choose role ('coach' or 'client'): ",
+    "email": "Enter your email: ",
+}
+
+def first_error(value, checks):
+    """Return the message of the first (is_valid, message) check that value fails, or None."""
+    for is_valid, message in checks:
+        if not is_valid(value):
+            return message
+    return None
 
-    while True:
-        role = input("Choose role ('coach' or 'client'): ").strip().lower()
-        if role not in ("coach", "client"):
-            print("Role must be 'coach' or 'client'.")
-            continue
-        break
+def hash_password(password):
+    """Return a salted scrypt hash of the password as "salt_hex:hash_hex"."""
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return salt.hex() + ":" + digest.hex()
 
-    while True:
-        email = input("Enter your email: ").strip()
-        if not email:
-            print("Email cannot be empty.")
-            continue
-        if "," in email:
-            print("Commas are not allowed in email.")
-            continue
-        break
+def verify_password(password, stored):
+    """
+    Check a password against a stored value from users.txt.
+    Anything that isn't exactly a 32-char hex salt and 64-char hex hash
+    (as written by hash_password) is treated as a legacy plain-text password.
+    """
+    salt_hex, sep, digest_hex = stored.partition(":")
+    try:
+        if not sep or len(salt_hex) != 32 or len(digest_hex) != 64:
+            raise ValueError("not a salt:hash value")
+        salt = bytes.fromhex(salt_hex)
+        expected = bytes.fromhex(digest_hex)
+    except ValueError:
+        return hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+    digest = hashlib.scrypt(password.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return hmac.compare_digest(digest, expected)
 
-    users.append([username, password, role, email])
-    save_to_file(USERS_FILE, users)
+def register_user():
+    """
+    Create a new user. Role must be 'coach' or 'client'.
+    Duplicate usernames are not allowed.
+    """
+    print("\n=== Register New User ===")
+    _, by_user = get_users()  # by_user[username] = [username,password,role,email]
+
+    def read(field):
+        value = input(REGISTER_PROMPTS[field]).strip()
+        return value.lower() if field == "role" else value
+
+    # Ask for everything up front, then re-prompt only the fields that fail a check.
+    values = {field: read(field) for field in REGISTER_PROMPTS}
+    rules = {
+        "username": [
+            (lambda v: v, "Username cannot be empty."),
+            (lambda v: "," not in v, "Commas are not allowed in username."),
+            (lambda v: v not in by_user, "That username is already taken. Try another."),
+        ],
+        "password": [
+            (lambda v: v, "Password cannot be empty."),
+        ],
+        "role": [
+            (lambda v: v in ("coach", "client"), "Role must be 'coach' or 'client'."),
+        ],
+        "email": [
+            (lambda v: v, "Email cannot be empty."),
+            (lambda v: "," not in v, "Commas are not allowed in email."),
+        ],
+    }
+    for field, checks in rules.items():
+        error = first_error(values[field], checks)
+        while error:
+            print(error)
+            values[field] = read(field)
+            error = first_error(values[field], checks)
+
+    username, password, role, email = (values[f] for f in REGISTER_PROMPTS)
+    add_user([username, hash_password(password), role, email])
     print(f"User '{username}' registered successfully as {role}!\n")
 
 def login_user():
@@ -134,31 +313,50 @@ def login_user():
     username = input("Username: ").strip()
     password = input("Password: ").strip()
 
-    users = load_from_file(USERS_FILE)
-    for row in users:
-        if len(row) != 4:
-            continue  # skip malformed rows
-        if row[0] == username and row[1] == password:
-            print(f"Welcome, {username}! You are logged in as {row[2]}.\n")
-            return {"username": row[0], "role": row[2], "email": row[3]}
+    _, by_user = get_users()
+    row = by_user.get(username)
+    if row is not None and verify_password(password, row[1]):
+        print(f"Welcome, {username}! You are logged in as {row[2]}.\n")
+        return {"username": row[0], "role": row[2], "email": row[3]}
     print("Invalid username or password.\n")
     return None
 
+# -------------------------------
+# Date helpers
+# -------------------------------
+
+def parse_dt(date_str, time_str):
+    """
+    Turn "YYYY-MM-DD" and "HH:MM" strings into a datetime.
+    Raise ValueError if the format or any of the values is invalid.
+    """
+    global _DT_RE
+    if _DT_RE is None:
+        import re
+        _DT_RE = re.compile(_DT_PATTERN)
+    match = _DT_RE.match(f"{date_str} {time_str}")
+    if match is None:
+        raise ValueError(f"invalid date/time: {date_str} {time_str}")
+    year, month, day, hour, minute = map(int, match.groups())
+    return datetime(year, month, day, hour, minute)
+
 # -------------------------------
 # Jitsi helpers
 # -------------------------------
 
-def generate_unique_id():
-    """Create a unique ID using current datetime and random characters."""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    rand = "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
+def generate_unique_id(now=None):
+    """Create a unique ID from a datetime (default: now) and random hex characters."""
+    import secrets  # imported here so logging in doesn't pay for it
+
+    if now is None:
+        now = datetime.now()
+    timestamp = now.strftime("%Y%m%d%H%M%S")
+    rand = secrets.token_hex(4).upper()  # 32 random bits, more than the old 6 A-Z0-9 chars
     return f"{timestamp}{rand}"
 
-def generate_jitsi_link():
+def generate_jitsi_link(now=None):
     """Create a unique Jitsi Meet room URL string."""
-    unique = generate_unique_id()
-    room_name = f"{ROOM_PREFIX}{unique}"
-    return JITSI_BASE_URL + room_name
+    return JITSI_ROOM_URL_PREFIX + generate_unique_id(now)
 
 # -------------------------------
 # Session management
@@ -167,8 +365,8 @@ def generate_jitsi_link():
 def schedule_session(coach_username):
     """Create a new session for a coach."""
     print("\n=== Schedule New Session ===")
-    users = load_from_file(USERS_FILE)
-    valid_clients = {u[0] for u in users if len(u) >= 3 and u[2] == "client"}
+    _, by_user = get_users()
+    valid_clients = {u[0] for u in by_user.values() if u[2] == "client"}
     if not valid_clients:
         print("No clients found. Ask someone to register as a client first.\n")
         return
@@ -185,8 +383,9 @@ def schedule_session(coach_username):
         date_str = input("Session date (YYYY-MM-DD): ").strip()
         time_str = input("Session time (HH:MM, 24-hour): ").strip()
         try:
-            scheduled_dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-            if scheduled_dt < datetime.now():
+            scheduled_dt = parse_dt(date_str, time_str)
+            now = datetime.now()
+            if scheduled_dt < now:
                 print("That time is in the past. Please choose a future time.")
                 continue
             break
@@ -194,14 +393,12 @@ def schedule_session(coach_username):
             print("Invalid date or time format. Please try again.")
             continue
 
-    session_id = generate_unique_id()
-    jitsi_link = generate_jitsi_link()
+    session_id = generate_unique_id(now)
+    jitsi_link = generate_jitsi_link(now)
     status = "scheduled"
     notes = ""
 
-    sessions = load_from_file(SESSIONS_FILE)
-    sessions.append([session_id, coach_username, client, date_str, time_str, jitsi_link, status, notes])
-    save_to_file(SESSIONS_FILE, sessions)
+    add_session([session_id, coach_username, client, date_str, time_str, jitsi_link, status, notes])
 
     print("\nSession created!")
     print(f"Session ID: {session_id}")
@@ -212,33 +409,31 @@ def schedule_session(coach_username):
 
 def view_sessions(current_user):
     """Display sessions for the logged-in user (coach or client)."""
-    print("\n=== My Sessions ===")
-    sessions = load_from_file(SESSIONS_FILE)
-    count = 0
-    for row in sessions:
-        if len(row) < 8:
-            continue
-        is_mine = (row[1] == current_user["username"]) or (row[2] == current_user["username"])
-        if is_mine:
-            count += 1
-            print("-" * 60)
-            print(f"ID: {row[0]}")
-            print(f"Coach: {row[1]} | Client: {row[2]}")
-            print(f"When: {row[3]} {row[4]} | Status: {row[6]}")
-            print(f"Jitsi: {row[5]}")
-            if row[7]:
-                print(f"Notes: {row[7]}")
-    if count == 0:
-        print("No sessions found.")
-    print("")
+    by_coach, by_client = get_session_indexes()
+    username = current_user["username"]
+    coached = by_coach.get(username)
+    attended = by_client.get(username)
+    if not coached and not attended:
+        print("\n=== My Sessions ===\nNo sessions found.\n")
+        return
+
+    # Build the whole listing first and write it to the terminal in one go.
+    out = ["\n=== My Sessions ==="]
+    for row in (coached or []) + (attended or []):
+        out.append(_SEP)
+        out.append(f"ID: {row[0]}")
+        out.append(f"Coach: {row[1]} | Client: {row[2]}")
+        out.append(f"When: {row[3]} {row[4]} | Status: {row[6]}")
+        out.append(f"Jitsi: {row[5]}")
+        if row[7]:
+            out.append(f"Notes: {row[7]}")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 def find_session_by_id(session_id):
     """Return (index, row) for a session id, or (None, None) if not found."""
-    sessions = load_from_file(SESSIONS_FILE)
-    for idx, row in enumerate(sessions):
-        if len(row) >= 1 and row[0] == session_id:
-            return idx, row
-    return None, None
+    _, by_id = get_sessions()
+    return by_id.get(session_id, (None, None))
 
 def edit_session(coach_username):
     """Allow a coach to change date/time or client for one of their sessions."""
@@ -261,27 +456,33 @@ def edit_session(coach_username):
     new_client = input(f"New client username [current: {row[2]}]: ").strip()
 
     if new_client:
-        users = load_from_file(USERS_FILE)
-        valid_clients = {u[0] for u in users if len(u) >= 3 and u[2] == "client"}
+        _, by_user = get_users()
+        valid_clients = {u[0] for u in by_user.values() if u[2] == "client"}
         if new_client not in valid_clients:
             print("Unknown client. Edit canceled.\n")
             return
-        row[2] = new_client
 
+    date_str = new_date if new_date else row[3]
+    time_str = new_time if new_time else row[4]
     if new_date or new_time:
-        date_str = new_date if new_date else row[3]
-        time_str = new_time if new_time else row[4]
         try:
-            _ = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-            row[3] = date_str
-            row[4] = time_str
+            parse_dt(date_str, time_str)
         except ValueError:
             print("Invalid date/time. Edit canceled.\n")
             return
 
-    sessions = load_from_file(SESSIONS_FILE)
-    sessions[idx] = row
-    save_to_file(SESSIONS_FILE, sessions)
+    # row is the cached object, so only change it once every input is valid.
+    if new_client and new_client != row[2]:
+        # Move the row between client index lists, keeping them in file order.
+        by_client = _SESSION_CACHE["by_client"]
+        by_id = _SESSION_CACHE["by_id"]
+        by_client[row[2]].remove(row)
+        by_client[new_client].append(row)
+        by_client[new_client].sort(key=lambda r: by_id[r[0]][0])
+        row[2] = new_client
+    row[3] = date_str
+    row[4] = time_str
+    flush_sessions()
     print("Session updated.\n")
 
 def cancel_session(coach_username):
@@ -299,9 +500,7 @@ def cancel_session(coach_username):
         print("Session already canceled.\n")
         return
     row[6] = "canceled"
-    sessions = load_from_file(SESSIONS_FILE)
-    sessions[idx] = row
-    save_to_file(SESSIONS_FILE, sessions)
+    flush_sessions()
     print("Session canceled.\n")
 
 def regenerate_link(coach_username):
@@ -320,9 +519,7 @@ def regenerate_link(coach_username):
         return
     new_link = generate_jitsi_link()
     row[5] = new_link
-    sessions = load_from_file(SESSIONS_FILE)
-    sessions[idx] = row
-    save_to_file(SESSIONS_FILE, sessions)
+    flush_sessions()
     print(f"New Jitsi link: {new_link}\n")
 
 def add_session_notes(coach_username):
@@ -339,13 +536,16 @@ def add_session_notes(coach_username):
     if row[6] == "canceled":
         print("This session is canceled.\n")
         return
-    existing = row[7] if len(row) >= 8 else ""
+    existing = row[7]
     print(f"Current notes: {existing!r}")
-    note = input("Add note: ").strip()
+    while True:
+        note = input("Add note: ").strip()
+        if "," in note:
+            print("Commas are not allowed in notes.")
+            continue
+        break
     row[7] = (existing + " | " if existing else "") + note if note else existing
-    sessions = load_from_file(SESSIONS_FILE)
-    sessions[idx] = row
-    save_to_file(SESSIONS_FILE, sessions)
+    flush_sessions()
     print("Notes updated.\n")
 
 def client_get_link(client_username):
@@ -368,18 +568,36 @@ def client_get_link(client_username):
 # Menus
 # -------------------------------
 
+# Each menu is shown with a single input() call instead of one print per line.
+_MAIN_MENU_TEXT = """\
+=== Fitness Coach Manager ===
+1. Register
+2. Login
+3. Exit
+Choose an option: """
+
+_COACH_MENU_TEXT = """\
+=== Coach Menu ===
+1. Schedule New Session
+2. View My Sessions
+3. Generate/Refresh Session Link
+4. Edit Session
+5. Cancel Session
+6. Add Session Notes
+7. Logout
+Choose an option: """
+
+_CLIENT_MENU_TEXT = """\
+=== Client Menu ===
+1. View My Sessions
+2. Join Session (get Jitsi link)
+3. Logout
+Choose an option: """
+
 def coach_menu(current_user):
     """Menu loop shown to coaches."""
     while True:
-        print("=== Coach Menu ===")
-        print("1. Schedule New Session")
-        print("2. View My Sessions")
-        print("3. Generate/Refresh Session Link")
-        print("4. Edit Session")
-        print("5. Cancel Session")
-        print("6. Add Session Notes")
-        print("7. Logout")
-        choice = input("Choose an option: ").strip()
+        choice = input(_COACH_MENU_TEXT).strip()
 
         if choice == "1":
             schedule_session(current_user["username"])
@@ -402,11 +620,7 @@ def coach_menu(current_user):
 def client_menu(current_user):
     """Menu loop shown to clients."""
     while True:
-        print("=== Client Menu ===")
-        print("1. View My Sessions")
-        print("2. Join Session (get Jitsi link)")
-        print("3. Logout")
-        choice = input("Choose an option: ").strip()
+        choice = input(_CLIENT_MENU_TEXT).strip()
 
         if choice == "1":
             view_sessions(current_user)
@@ -425,11 +639,7 @@ def client_menu(current_user):
 def main():
     bootstrap_files()
     while True:
-        print("=== Fitness Coach Manager ===")
-        print("1. Register")
-        print("2. Login")
-        print("3. Exit")
-        choice = input("Choose an option: ").strip()
+        choice = input(_MAIN_MENU_TEXT).strip()
 
         if choice == "1":
             register_user()